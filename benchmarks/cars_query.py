@@ -0,0 +1,89 @@
+# benchmarks/cars_query.py
+"""Latency of cars queries with and without the declared indexes.
+
+Fills a scratch collection in a separate `<MONGO_DB_NAME>_bench` database,
+so the crawl data is never touched.
+
+Usage: python -m benchmarks.cars_query [documents]
+"""
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from pymongo import MongoClient
+
+from core.config.settings import CARS_COLLECTION, MONGO_DB_NAME, MONGO_URI
+from core.queries import ensure_indexes, find_cars
+
+BRANDS = ['BMW', 'BYD', 'Audi', 'Chevrolet', 'Ford', 'Hyundai', 'Kia', 'Toyota']
+QUERIES = {
+    'recent': {},
+    'brand': {'brand': 'BMW'},
+    'brand + year range': {'brand': 'BMW', 'min_year': 2018, 'max_year': 2021},
+    'brand + year + price': {'brand': 'BYD', 'min_year': 2015, 'max_year': 2022,
+                             'min_price': 10_000_000, 'max_price': 20_000_000},
+    'price range': {'min_price': 30_000_000, 'max_price': 32_000_000},
+}
+BATCH_SIZE = 10_000
+RUNS = 20
+
+
+def fill(collection, documents):
+    collection.drop()
+    now = datetime.now(timezone.utc)
+    for start in range(0, documents, BATCH_SIZE):
+        batch = []
+        for n in range(start, min(start + BATCH_SIZE, documents)):
+            brand = random.choice(BRANDS)
+            year = random.randint(2005, 2024)
+            batch.append({
+                'url': f'https://www.chileautos.cl/vehiculos/detalles/{n}',
+                'title': f'{year} {brand} Model {n % 50}',
+                'brand': brand,
+                'year': year,
+                'price': float(random.randint(3_000, 60_000) * 1000),
+                'mileage': random.randint(0, 250_000),
+                'seen_at': now - timedelta(seconds=random.randint(0, 90 * 24 * 3600)),
+            })
+        collection.insert_many(batch, ordered=False)
+
+
+def measure(collection):
+    results = {}
+    for name, criteria in QUERIES.items():
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            docs, cursor = find_cars(collection, limit=20, **criteria)
+            # Second page, to cover keyset pagination
+            if cursor is not None:
+                find_cars(collection, limit=20, after=cursor, **criteria)
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = statistics.median(timings)
+    return results
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    client = MongoClient(MONGO_URI)
+    collection = client[f'{MONGO_DB_NAME}_bench'][CARS_COLLECTION]
+    try:
+        print(f"Inserting {documents} documents...")
+        fill(collection, documents)
+
+        without = measure(collection)
+        ensure_indexes(collection)
+        with_indexes = measure(collection)
+
+        print(f"{'query':<24}{'no index (ms)':>16}{'indexed (ms)':>16}")
+        for name in QUERIES:
+            print(f"{name:<24}{without[name]:>16.2f}{with_indexes[name]:>16.2f}")
+    finally:
+        collection.drop()
+        client.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/parse_executor.py
+"""Items/sec of listing page parsing, inline vs. the parse executor.
+
+Usage: python -m benchmarks.parse_executor [pages] [items_per_page]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from core.parse_executor import ParseExecutor
+from core.spiders.chileautos.item_parser import extract_listing_items
+
+URL = 'https://www.chileautos.cl/vehiculos/?offset=0'
+
+LISTING_ITEM = '''
+<div class="listing-item">
+  <h3><a href="/vehiculos/detalles/{n}">BMW X{n} 2021 xDrive</a></h3>
+  <div class="price">$ {n}9.990.000</div>
+  <ul>
+    <li class="key-details__item">
+      <span class="key-details__label">Año:</span>
+      <span class="key-details__value">2021</span>
+    </li>
+    <li class="key-details__item">
+      <span class="key-details__label">Kilómetros:</span>
+      <span class="key-details__value">{n}5.000 km</span>
+    </li>
+  </ul>
+</div>
+'''
+
+
+def build_page(items_per_page):
+    items = ''.join(LISTING_ITEM.format(n=n) for n in range(items_per_page))
+    html = f'<html><body><div class="listing-items">{items}</div></body></html>'
+    return html.encode()
+
+
+def bench_inline(bodies):
+    start = time.perf_counter()
+    items = sum(len(extract_listing_items(body, URL, 'utf-8')) for body in bodies)
+    return items / (time.perf_counter() - start)
+
+
+def parse(executor, body):
+    return executor.run(extract_listing_items, body, URL, 'utf-8')
+
+
+async def bench_executor(bodies, workers):
+    executor = ParseExecutor(enabled=True, workers=workers, inline_threshold=0)
+    try:
+        # Warm up the pool so process start-up is not measured
+        await asyncio.gather(*(parse(executor, bodies[0]) for _ in range(workers)))
+        start = time.perf_counter()
+        results = await asyncio.gather(*(parse(executor, body) for body in bodies))
+        return sum(len(rows) for rows in results) / (time.perf_counter() - start)
+    finally:
+        executor.shutdown()
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    items_per_page = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    bodies = [build_page(items_per_page)] * pages
+    page_kib = len(bodies[0]) // 1024
+    print(f"{pages} pages x {items_per_page} items ({page_kib} KiB per page)")
+    print(f"{'inline':>10}: {bench_inline(bodies):10.0f} items/sec")
+
+    cores = os.cpu_count() or 1
+    workers = 1
+    while True:
+        rate = asyncio.run(bench_executor(bodies, workers))
+        print(f"{workers:>3} cores : {rate:10.0f} items/sec")
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+
+
+if __name__ == '__main__':
+    main()
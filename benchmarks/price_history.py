@@ -0,0 +1,97 @@
+# benchmarks/price_history.py
+"""Bytes per listing-day and lookup latency of the price history store.
+
+Simulates daily crawls of a catalogue in which a few listings change price
+or mileage each day, in a temporary directory.
+
+Usage: python -m benchmarks.price_history [listings] [days] [change_rate]
+"""
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from core.history import PriceHistoryStore
+
+START = date(2026, 1, 1)
+LOOKUPS = 1000
+
+
+def disk_usage(root):
+    """Returns (logical bytes, allocated bytes) of every file under root.
+
+    Each listing has its own small file, which still takes at least one
+    filesystem block, so the allocated size is the one that counts on disk.
+    """
+    logical = allocated = 0
+    for path in Path(root).rglob('*'):
+        if path.is_file():
+            stat = path.stat()
+            logical += stat.st_size
+            allocated += stat.st_blocks * 512
+    return logical, allocated
+
+
+def median_ms(func, args_list):
+    timings = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def report(store, root, urls, days):
+    listing_days = len(urls) * days
+    logical, allocated = disk_usage(root)
+    print(f"  bytes per listing-day: {logical / listing_days:8.2f} logical, "
+          f"{allocated / listing_days:.2f} allocated on disk")
+    sample = [(url,) for url in random.sample(urls, min(LOOKUPS, len(urls)))]
+    print(f"  timeline lookup:       {median_ms(store.timeline, sample):8.3f} ms")
+    windows = [(START + timedelta(d), START + timedelta(d + 6))
+               for d in random.choices(range(max(days - 6, 1)), k=100)]
+    print(f"  7-day price drops:     {median_ms(store.price_drops, windows):8.3f} ms")
+
+
+def main():
+    listings = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+    change_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+
+    base = 'https://www.chileautos.cl/vehiculos/detalles/auto'
+    urls = [f'{base}/CP-AD-{n}/' for n in range(listings)]
+    state = {url: [random.randint(3_000, 60_000) * 1000, random.randint(0, 250_000)]
+             for url in urls}
+    snapshot = {'title': '2021 BMW X3 xDrive30e', 'brand': 'BMW', 'year': 2021,
+                'price': 29990000.0, 'mileage': 45000, 'url': urls[0]}
+
+    with tempfile.TemporaryDirectory() as root:
+        store = PriceHistoryStore(root)
+        start = time.perf_counter()
+        for day in range(days):
+            for url in urls:
+                if day and random.random() < change_rate:
+                    state[url][0] = int(state[url][0] * random.uniform(0.9, 1.02))
+                    state[url][1] += random.randint(0, 2_000)
+                store.record(url, *state[url], day=START + timedelta(day))
+        elapsed = time.perf_counter() - start
+
+        print(f"{listings} listings x {days} days, {change_rate:.0%} changing per day")
+        throughput = listings * days / elapsed
+        snapshot_bytes = len(json.dumps(snapshot))
+        print(f"  record throughput:     {throughput:8.0f} observations/sec")
+        print(f"  full JSON snapshot:    {snapshot_bytes:8d} bytes per listing-day")
+        print("append-only:")
+        report(store, root, urls, days)
+
+        store.compact()
+        print("after compaction:")
+        report(store, root, urls, days)
+
+
+if __name__ == '__main__':
+    main()
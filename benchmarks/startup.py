@@ -0,0 +1,93 @@
+# benchmarks/startup.py
+"""Cold-start import time of the crawler's entry points.
+
+Every sample is a fresh interpreter, so nothing is shared between runs.
+Pass a git ref with --against to profile that revision too (in a temporary
+worktree), e.g. the commit before the lazy-import changes:
+
+Usage: python -m benchmarks.startup [--runs N] [--against REF] [--top N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'settings': 'import core.settings',
+    'spider module': 'import core.spiders.chileautos',
+    'pipelines': 'import core.pipelines',
+    'spider + config': (
+        'import core.settings\n'
+        'from core.spiders.chileautos import ChileautosSpider\n'
+        'ChileautosSpider()'
+    ),
+}
+
+
+def time_target(code, cwd, runs):
+    """Median wall time in ms of a fresh interpreter running code"""
+    env = {**os.environ, 'PYTHONPATH': cwd, 'PYTHONDONTWRITEBYTECODE': '1'}
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def heaviest_imports(code, cwd, top):
+    """Top-level packages with the highest cumulative import time, from -X importtime"""
+    env = {**os.environ, 'PYTHONPATH': cwd}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=cwd,
+                            env=env, check=True, capture_output=True, text=True)
+    totals = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        totals[package] = max(totals.get(package, 0), int(cumulative))
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def profile(cwd, runs, top):
+    for name, code in TARGETS.items():
+        print(f"{name:<18}{time_target(code, cwd, runs):10.1f} ms")
+        for package, micros in heaviest_imports(code, cwd, top):
+            print(f"{'':<4}{package:<24}{micros / 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--against', metavar='REF')
+    parser.add_argument('--top', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.against:
+        with tempfile.TemporaryDirectory() as tmp:
+            worktree = os.path.join(tmp, 'worktree')
+            subprocess.run(
+                ['git', 'worktree', 'add', '--detach', worktree, args.against],
+                cwd=PROJECT_ROOT, check=True, capture_output=True,
+            )
+            try:
+                print(f"== {args.against}")
+                profile(worktree, args.runs, args.top)
+            finally:
+                subprocess.run(['git', 'worktree', 'remove', '--force', worktree],
+                               cwd=PROJECT_ROOT, check=True)
+        print()
+
+    print("== working tree")
+    profile(PROJECT_ROOT, args.runs, args.top)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+# core/config/artifacts.py
+"""Cached, validated binary versions of the JSON config files.
+
+filters.json and dic.json are parsed and validated once, then pickled into
+.cache/. Later runs load the pickle as long as the source file's mtime and
+size are unchanged; editing the JSON invalidates the artifact. Within a
+process, loaded configs are also kept in memory.
+"""
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = PROJECT_ROOT / '.cache'
+FILTERS_PATH = PROJECT_ROOT / 'filters.json'
+DICTIONARY_PATH = PROJECT_ROOT / 'dic.json'
+
+# Bump when the validated shape changes, so stale artifacts are rebuilt
+ARTIFACT_VERSION = 1
+
+logger = logging.getLogger(__name__)
+_loaded = {}
+
+
+class ConfigValidationError(ValueError):
+    """Raised when a config file does not have the expected shape."""
+    pass
+
+
+def validate_filters(raw):
+    """Checks filters.json and returns its 'filters' section"""
+    filters = raw.get('filters', {}) if isinstance(raw, dict) else None
+    if not isinstance(filters, dict):
+        raise ConfigValidationError("'filters' must be an object")
+
+    max_pages = filters.get('max_pages')
+    if max_pages is not None and (not isinstance(max_pages, int) or max_pages < 0):
+        raise ConfigValidationError(
+            "'max_pages' must be a non-negative integer or null"
+        )
+
+    for key in ('brands', 'models'):
+        values = filters.get(key, [])
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ConfigValidationError(f"'{key}' must be a list of strings")
+    return filters
+
+
+def validate_dictionary(raw):
+    """Checks dic.json and returns it unchanged"""
+    if not isinstance(raw, dict) or not isinstance(raw.get('vehicleTypes'), dict):
+        raise ConfigValidationError("'vehicleTypes' must be an object")
+
+    for name, vehicle_type in raw['vehicleTypes'].items():
+        if not isinstance(vehicle_type, dict):
+            raise ConfigValidationError(f"'{name}' must be an object")
+        if not isinstance(vehicle_type.get('categories', []), list):
+            raise ConfigValidationError(f"'{name}.categories' must be a list")
+        brands = vehicle_type.get('brands', {})
+        if not isinstance(brands, dict) or not all(
+            isinstance(models, list) for models in brands.values()
+        ):
+            raise ConfigValidationError(
+                f"'{name}.brands' must map brands to model lists"
+            )
+    return raw
+
+
+def load_artifact(source, validate):
+    """Returns the validated contents of a JSON config file, using the cache"""
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Config not found at: {source}")
+    stat = source.stat()
+    key = (ARTIFACT_VERSION, stat.st_mtime_ns, stat.st_size)
+
+    cached = _loaded.get(source)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    artifact = CACHE_DIR / f'{source.name}.pickle'
+    data = _read_artifact(artifact, key)
+    if data is None:
+        with open(source, 'r', encoding='utf-8') as f:
+            try:
+                raw = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ConfigValidationError(f"Invalid JSON in {source}: {str(e)}")
+        data = validate(raw)
+        _write_artifact(artifact, key, data)
+
+    _loaded[source] = (key, data)
+    return data
+
+
+def load_filters():
+    return load_artifact(FILTERS_PATH, validate_filters)
+
+
+def load_dictionary():
+    return load_artifact(DICTIONARY_PATH, validate_dictionary)
+
+
+def catalogue_brands(dictionary):
+    """All brand names listed in dic.json, across vehicle types"""
+    brands = set()
+    for vehicle_type in dictionary['vehicleTypes'].values():
+        brands.update(vehicle_type.get('brands', {}))
+    return brands
+
+
+def _read_artifact(artifact, key):
+    try:
+        with open(artifact, 'rb') as f:
+            stored_key, data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config artifact {artifact}: {str(e)}")
+        return None
+    return data if stored_key == key else None
+
+
+def _write_artifact(artifact, key, data):
+    # Written to a temporary file first, so concurrent runs never read half an artifact
+    try:
+        artifact.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=artifact.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, artifact)
+    except OSError as e:
+        # The cache is only an optimization; a read-only checkout still works
+        logger.warning(f"Could not write config artifact {artifact}: {str(e)}")
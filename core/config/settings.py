@@ -1,12 +1,30 @@
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# MongoDB settings
-MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')
-MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'scrapy_db')
 
 # Collection names
 CARS_COLLECTION = 'cars'
+
+# MongoDB settings, read from the environment (and the .env file) the first
+# time one of them is accessed, e.g. `settings.MONGO_URI`
+_ENV_DEFAULTS = {
+    'MONGO_URI': 'mongodb://localhost:27017',
+    'MONGO_DB_NAME': 'scrapy_db',
+}
+_env_loaded = False
+
+
+def load_env():
+    """Loads environment variables from the .env file, once"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def __getattr__(name):
+    if name in _ENV_DEFAULTS:
+        load_env()
+        value = os.getenv(name, _ENV_DEFAULTS[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,347 @@
+# core/history.py
+"""Append-only price and mileage history per listing.
+
+Only changes are stored. Each listing has its own file under
+`<root>/listings/`, made of a header with the listing URL followed by one
+record per change:
+
+    varint(day - previous day)
+    zigzag(price - previous price)
+    zigzag(mileage - previous mileage)
+
+Days are date ordinals, and the first record is relative to zero. A
+listing's timeline is read from its own file, so unchanged listings never
+have to be scanned.
+
+Price drops are also appended to `<root>/drops.bin` as fixed-size records
+ordered by day. A date window is found by binary search over that file.
+Torn final writes in either kind of file are truncated by the writer
+before its next append; readers skip them.
+
+Observations must arrive in time order. The store assumes a single writer,
+which is the crawl's pipeline. compact() keeps only the last change
+recorded on each day, rewriting just the listing files that this shortens,
+and rebuilds the drops file from the compacted timelines.
+"""
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+from collections import namedtuple
+from datetime import date
+from pathlib import Path
+
+PricePoint = namedtuple('PricePoint', ['day', 'price', 'mileage'])
+PriceDrop = namedtuple('PriceDrop', ['url', 'day', 'old_price', 'new_price'])
+
+LISTING_MAGIC = b'PH1'
+# day ordinal, listing key, old price, new price
+DROP_RECORD = struct.Struct('<IQqq')
+
+
+def encode_varint(value):
+    """Encodes a non-negative integer as LEB128"""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_varint(data, pos):
+    """Decodes a LEB128 integer at pos; returns (value, next_pos).
+
+    Raises IndexError if data ends in the middle of the integer.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def listing_key(url):
+    """64-bit key identifying a listing, used for file names and drop records"""
+    return int.from_bytes(hashlib.sha1(url.encode('utf-8')).digest()[:8], 'big')
+
+
+class PriceHistoryStore:
+    """Delta-encoded, append-only history of listing prices and mileage."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.listings_dir = self.root / 'listings'
+        self.drops_path = self.root / 'drops.bin'
+        self.logger = logging.getLogger(__name__)
+        # Last known (day, price, mileage) per listing key, filled on demand
+        self._last = {}
+        self._urls = {}
+
+    def record(self, url, price, mileage, day=None):
+        """Records an observation; returns True if it changed the listing's history.
+
+        A None price or mileage means the value was not found on the page:
+        the last known value is kept for it, and an observation with neither
+        value records nothing. A listing first seen without a value stores 0
+        for it, which never counts as a price drop.
+        """
+        if price is None and mileage is None:
+            return False
+        day = (day or date.today()).toordinal()
+        key = listing_key(url)
+        path = self._listing_path(key)
+
+        if key not in self._last:
+            self._last[key] = self._load_last(path, url)
+        last = self._last[key]
+
+        if last is not None:
+            last_day, last_price, last_mileage = last
+            if day < last_day:
+                raise ValueError(
+                    f"Observation for {url} on {date.fromordinal(day)} is older "
+                    f"than its last change on {date.fromordinal(last_day)}"
+                )
+        else:
+            last_day, last_price, last_mileage = 0, 0, 0
+
+        price = last_price if price is None else int(round(price))
+        mileage = last_mileage if mileage is None else int(mileage)
+        if last is not None and (price, mileage) == (last_price, last_mileage):
+            return False
+
+        record = (encode_varint(day - last_day)
+                  + encode_varint(zigzag(price - last_price))
+                  + encode_varint(zigzag(mileage - last_mileage)))
+        try:
+            if last is None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                encoded_url = url.encode('utf-8')
+                header = LISTING_MAGIC + encode_varint(len(encoded_url)) + encoded_url
+                record = header + record
+            with open(path, 'ab') as f:
+                f.write(record)
+            self._last[key] = (day, price, mileage)
+
+            if last is not None and 0 < price < last_price:
+                self._append_drop(DROP_RECORD.pack(day, key, last_price, price))
+        except Exception:
+            # The file may not match what we remember any more: reload it (and
+            # truncate a torn write) on the next observation
+            self._last.pop(key, None)
+            raise
+        return True
+
+    def timeline(self, url):
+        """Returns every recorded change of a listing, oldest first"""
+        path = self._listing_path(listing_key(url))
+        if not path.exists():
+            return []
+        stored_url, points, _ = self._read_listing(path)
+        if stored_url != url:
+            return []
+        return [PricePoint(date.fromordinal(d), p, m) for d, p, m in points]
+
+    def price_drops(self, start, end):
+        """Returns every price drop between start and end (inclusive), by day"""
+        if not self.drops_path.exists():
+            return []
+        # A partial record still being appended is skipped by the count below;
+        # readers never truncate, only the writer does
+        start, end = start.toordinal(), end.toordinal()
+        drops = []
+        with open(self.drops_path, 'rb') as f:
+            count = os.fstat(f.fileno()).st_size // DROP_RECORD.size
+
+            # Binary search for the first record on or after start
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                f.seek(middle * DROP_RECORD.size)
+                if DROP_RECORD.unpack(f.read(DROP_RECORD.size))[0] < start:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            f.seek(low * DROP_RECORD.size)
+            for _ in range(low, count):
+                record = f.read(DROP_RECORD.size)
+                day, key, old_price, new_price = DROP_RECORD.unpack(record)
+                if day > end:
+                    break
+                drops.append(PriceDrop(self._url_for(key), date.fromordinal(day),
+                                       old_price, new_price))
+        return drops
+
+    def compact(self):
+        """Rewrites listing files that merging changes and rebuilds the drops file"""
+        drops = []
+        listings = rewritten = 0
+        for path in sorted(self.listings_dir.glob('*/*.bin')):
+            url, points, valid_length = self._read_listing(path)
+            if url is None:
+                continue
+            merged = self._merge_days(points)
+            if len(merged) != len(points) or valid_length < path.stat().st_size:
+                self._rewrite(path, self._encode_listing(url, merged))
+                rewritten += 1
+            points = merged
+
+            key = int(path.stem, 16)
+            for (_, old_price, _), (day, new_price, _) in zip(points, points[1:]):
+                if 0 < new_price < old_price:
+                    drops.append(DROP_RECORD.pack(day, key, old_price, new_price))
+            if points:
+                self._last[key] = points[-1]
+            listings += 1
+
+        drops.sort(key=DROP_RECORD.unpack)
+        if listings:
+            self._rewrite(self.drops_path, b''.join(drops))
+        self.logger.info(
+            f"Compacted price history: {rewritten} of {listings} listings "
+            f"rewritten, {len(drops)} price drops"
+        )
+
+    def compact_if_due(self, interval_days, today=None):
+        """Runs compact() if the last compaction is older than interval_days"""
+        today = (today or date.today()).toordinal()
+        marker = self.root / 'compacted'
+        try:
+            last = int(marker.read_text())
+        except (FileNotFoundError, ValueError):
+            last = 0
+        if today - last < interval_days:
+            return False
+        self.compact()
+        self.root.mkdir(parents=True, exist_ok=True)
+        marker.write_text(str(today))
+        return True
+
+    def _append_drop(self, record):
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._repair_drops()
+        with open(self.drops_path, 'ab') as f:
+            f.write(record)
+
+    def _repair_drops(self):
+        """Truncates a torn final write, which would misalign every later record"""
+        try:
+            size = self.drops_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size % DROP_RECORD.size:
+            self.logger.warning(
+                f"Truncating incomplete record at end of {self.drops_path}"
+            )
+            with open(self.drops_path, 'r+b') as f:
+                f.truncate(size - size % DROP_RECORD.size)
+
+    def _listing_path(self, key):
+        name = f'{key:016x}'
+        return self.listings_dir / name[:2] / f'{name}.bin'
+
+    def _url_for(self, key):
+        if key not in self._urls:
+            url, _, _ = self._read_listing(self._listing_path(key), header_only=True)
+            self._urls[key] = url
+        return self._urls[key]
+
+    def _load_last(self, path, url):
+        """Returns the last state of a listing, repairing a torn final write"""
+        if not path.exists():
+            return None
+        stored_url, points, valid_length = self._read_listing(path)
+        if stored_url is None:
+            path.unlink()
+            return None
+        if stored_url != url:
+            raise ValueError(f"Listing key collision between {url} and {stored_url}")
+        if not points:
+            # Only the header made it to disk: start the listing over
+            path.unlink()
+            return None
+        if valid_length < path.stat().st_size:
+            self.logger.warning(f"Truncating incomplete record at end of {path}")
+            with open(path, 'r+b') as f:
+                f.truncate(valid_length)
+        return points[-1] if points else None
+
+    def _read_listing(self, path, header_only=False):
+        """Decodes a listing file into (url, [(day, price, mileage)], valid_length)"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(LISTING_MAGIC):
+            return None, [], 0
+        try:
+            length, pos = decode_varint(data, len(LISTING_MAGIC))
+            url = data[pos:pos + length].decode('utf-8')
+        except (IndexError, UnicodeDecodeError):
+            return None, [], 0
+        pos += length
+        valid_length = pos
+        points = []
+        if header_only:
+            return url, points, valid_length
+
+        day = price = mileage = 0
+        try:
+            while pos < len(data):
+                day_delta, pos = decode_varint(data, pos)
+                price_delta, pos = decode_varint(data, pos)
+                mileage_delta, pos = decode_varint(data, pos)
+                day += day_delta
+                price += unzigzag(price_delta)
+                mileage += unzigzag(mileage_delta)
+                points.append((day, price, mileage))
+                valid_length = pos
+        except IndexError:
+            # Torn final write; everything before it is intact
+            pass
+        return url, points, valid_length
+
+    def _merge_days(self, points):
+        """Keeps the last change of each day, skipping days that end unchanged"""
+        merged = []
+        for point in points:
+            if merged and merged[-1][0] == point[0]:
+                merged.pop()
+            if merged and merged[-1][1:] == point[1:]:
+                continue
+            merged.append(point)
+        return merged
+
+    def _encode_listing(self, url, points):
+        encoded_url = url.encode('utf-8')
+        out = bytearray(LISTING_MAGIC + encode_varint(len(encoded_url)) + encoded_url)
+        last_day = last_price = last_mileage = 0
+        for day, price, mileage in points:
+            out += encode_varint(day - last_day)
+            out += encode_varint(zigzag(price - last_price))
+            out += encode_varint(zigzag(mileage - last_mileage))
+            last_day, last_price, last_mileage = day, price, mileage
+        return bytes(out)
+
+    def _rewrite(self, path, data):
+        # Replace atomically so a crash never leaves a half-written file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -15,6 +15,7 @@ class CoreItem(scrapy.Item):
 class CarItem(scrapy.Item):
     """Item representing a car with its basic information."""
     title = scrapy.Field()
+    brand = scrapy.Field()
     price = scrapy.Field()
     mileage = scrapy.Field()
     year = scrapy.Field()
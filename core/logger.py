@@ -1,15 +1,24 @@
 import logging
 import colorlog
-from rich.console import Console
 
-console = Console()
+# rich is imported on first JSON log line, so importing this module
+# (and core.settings) stays cheap for commands that never print one
+_console = None
+
+
+def get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 # Define a custom class that overrides info()
 class CustomLogger(logging.Logger):
     def info(self, msg, *args, **kwargs):
         # Detect if it's JSON
         if isinstance(msg, (dict, list)):
-            console.print_json(data=msg)  # Print JSON with colors
+            get_console().print_json(data=msg)  # Print JSON with colors
         else:
             # If it's not JSON, call the original method
             super().info(msg, *args, **kwargs)
@@ -0,0 +1,76 @@
+# core/parse_executor.py
+import asyncio
+import logging
+import os
+
+
+class ParseExecutor:
+    """Runs HTML extraction in a pool of worker processes.
+
+    Keeps the reactor thread free while lxml parses large pages and lets
+    parsing use more than one core. Small pages are parsed inline, since
+    shipping them to a worker costs more than parsing them.
+    """
+
+    def __init__(self, enabled=False, workers=None, max_in_flight=None,
+                 inline_threshold=64 * 1024):
+        self.enabled = enabled
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self.inline_threshold = inline_threshold
+        self.logger = logging.getLogger(__name__)
+        self._pool = None
+        self._semaphore = None
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            enabled=settings.getbool('PARSE_EXECUTOR_ENABLED', False),
+            workers=settings.getint('PARSE_EXECUTOR_WORKERS', 0) or None,
+            max_in_flight=settings.getint('PARSE_EXECUTOR_MAX_IN_FLIGHT', 0) or None,
+            inline_threshold=settings.getint(
+                'PARSE_EXECUTOR_INLINE_THRESHOLD', 64 * 1024
+            ),
+        )
+
+    def should_offload(self, body):
+        """Whether a response body is worth sending to a worker process"""
+        return self.enabled and len(body) >= self.inline_threshold
+
+    async def run(self, func, *args):
+        """Runs func(*args) in a worker process and awaits the result.
+
+        At most max_in_flight calls are queued in the pool at once; further
+        callers wait here, which backs the spider off instead of piling up
+        response bytes in memory.
+        """
+        if self._pool is None:
+            self._start()
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, func, *args)
+
+    def _start(self):
+        # Imported here so spiders that never offload skip multiprocessing
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.logger.info(
+            f"Starting parse executor with {self.workers} workers "
+            f"(max in flight: {self.max_in_flight})"
+        )
+        # By now the process runs MongoClient monitors and the index build
+        # thread, so workers must not be forked from it
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('forkserver'),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+    def shutdown(self):
+        """Stops the worker processes, if they were ever started"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._semaphore = None
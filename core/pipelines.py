@@ -5,37 +5,38 @@
 
 
 # useful for handling different item types with a single interface
-import os
 import logging
-from dotenv import load_dotenv
+import threading
+from datetime import datetime, timezone
 from pymongo import MongoClient
 from pymongo.errors import ServerSelectionTimeoutError, PyMongoError
 from scrapy.exceptions import DropItem
 from itemadapter import ItemAdapter
 import json
 from pprint import pformat
-
-# Load environment variables
-load_dotenv()
-
-# Get MongoDB configuration from environment variables
-MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')
-MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'scrapy_db')
+from core.config import settings as config
+from core.config.settings import CARS_COLLECTION
+from core.history import PriceHistoryStore
+from core.queries import ensure_indexes
 
 class MongoDBConnectionError(Exception):
     """Custom exception for MongoDB connection errors."""
     pass
 
 class MongoDBPipeline:
-    """Pipeline for storing car items in MongoDB."""
+    """Pipeline storing the latest state of each car in MongoDB.
+
+    Price and mileage changes over time are kept by PriceHistoryPipeline.
+    """
     
-    collection_name = 'cars'
+    collection_name = CARS_COLLECTION
 
     def __init__(self):
         self.client = None
         self.db = None
         self.items_processed = 0
         self.items_dropped = 0
+        self.index_thread = None
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
 
@@ -43,12 +44,12 @@ class MongoDBPipeline:
         """Test MongoDB connection and database access."""
         try:
             # Try to connect with a shorter timeout
-            self.client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+            self.client = MongoClient(config.MONGO_URI, serverSelectionTimeoutMS=5000)
             # Force a connection check
             self.client.server_info()
             
             # Test database access
-            self.db = self.client[MONGO_DB_NAME]
+            self.db = self.client[config.MONGO_DB_NAME]
             self.db.list_collection_names()
             
             self.logger.info("MongoDB connection test successful")
@@ -65,7 +66,10 @@ class MongoDBPipeline:
         try:
             # Test connection before proceeding
             self.check_connection()
-            self.logger.info(f"Successfully connected to MongoDB database: {MONGO_DB_NAME}")
+            self.logger.info(
+                f"Successfully connected to MongoDB database: {config.MONGO_DB_NAME}"
+            )
+            self.start_index_build()
         except MongoDBConnectionError as e:
             self.logger.error("Spider initialization failed due to MongoDB connection error")
             raise
@@ -73,9 +77,26 @@ class MongoDBPipeline:
             self.logger.error(f"Unexpected error during spider initialization: {str(e)}")
             raise
 
+    def start_index_build(self):
+        """Builds collection indexes in the background so the crawl is not blocked."""
+        self.index_thread = threading.Thread(
+            target=self._build_indexes, name='mongo-index-build', daemon=True
+        )
+        self.index_thread.start()
+
+    def _build_indexes(self):
+        try:
+            ensure_indexes(self.db[self.collection_name])
+        except PyMongoError as e:
+            # Queries still work without indexes, only slower
+            self.logger.error(f"Failed to build MongoDB indexes: {str(e)}")
+
     def close_spider(self, spider):
         """Close MongoDB connection when spider finishes."""
         self.logger.info("Closing MongoDB connection...")
+        if self.index_thread and self.index_thread.is_alive():
+            self.logger.info("Waiting for MongoDB index build to finish...")
+            self.index_thread.join()
         if self.client:
             self.client.close()
         self.logger.info("Pipeline finished. Summary:")
@@ -88,7 +109,10 @@ class MongoDBPipeline:
     def process_item(self, item, spider):
         """Process and store item in MongoDB."""
         adapter = ItemAdapter(item)
-        
+        if not adapter.get('url'):
+            self.items_dropped += 1
+            raise DropItem("Missing url, which identifies the car in MongoDB")
+
         try:
             # Verify connection is still alive before inserting
             self.client.server_info()
@@ -97,8 +121,11 @@ class MongoDBPipeline:
             self.logger.info("🚀 *** Processing item *** 🚀")
             self.logger.info(dict)
 
-            # Insert into MongoDB
-            self.db[self.collection_name].insert_one(dict)
+            # Keep one document per listing, holding its latest state
+            dict['seen_at'] = datetime.now(timezone.utc)
+            self.db[self.collection_name].update_one(
+                {'url': dict['url']}, {'$set': dict}, upsert=True
+            )
             self.items_processed += 1
             self.logger.info("Stored car in MongoDB successfully!")
             return item
@@ -112,3 +139,48 @@ class MongoDBPipeline:
             self.items_dropped += 1
             self.logger.error(f"Failed to store item in MongoDB: {str(e)}")
             raise DropItem(f"Failed to store item: {str(e)}")
+
+
+class PriceHistoryPipeline:
+    """Pipeline recording price and mileage changes in the price history store."""
+
+    def __init__(self, history_dir, compact_interval_days):
+        self.history_dir = history_dir
+        self.compact_interval_days = compact_interval_days
+        self.store = None
+        self.changes_recorded = 0
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            crawler.settings.get('PRICE_HISTORY_DIR', 'history'),
+            crawler.settings.getint('PRICE_HISTORY_COMPACT_INTERVAL_DAYS', 7),
+        )
+
+    def open_spider(self, spider):
+        self.store = PriceHistoryStore(self.history_dir)
+
+    def close_spider(self, spider):
+        if self.store is None:
+            return
+        self.logger.info(f"Price history changes recorded: {self.changes_recorded}")
+        self.store.compact_if_due(self.compact_interval_days)
+
+    def process_item(self, item, spider):
+        """Record the item's price and mileage; items are always passed on."""
+        adapter = ItemAdapter(item)
+        if not adapter.get('url'):
+            return item
+        try:
+            changed = self.store.record(
+                adapter['url'], adapter.get('price'), adapter.get('mileage')
+            )
+            if changed:
+                self.changes_recorded += 1
+        except (OSError, ValueError) as e:
+            # History is secondary to storing the item, so don't drop it
+            self.logger.error(
+                f"Failed to record price history for {adapter['url']}: {str(e)}"
+            )
+        return item
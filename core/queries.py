@@ -0,0 +1,123 @@
+# core/queries.py
+"""Indexes and read queries over the cars collection."""
+import logging
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+# Fields returned by default. Every one of them is stored in both indexes
+# below, so searches using this projection are answered from the index
+# without fetching documents.
+SUMMARY_PROJECTION = {
+    '_id': 1,
+    'seen_at': 1,
+    'brand': 1,
+    'year': 1,
+    'price': 1,
+    'mileage': 1,
+}
+
+# Equality (brand) first, then the sort keys, then the range fields, so
+# brand + year/price filters are resolved inside the index in sort order.
+CARS_INDEXES = [
+    IndexModel(
+        [('brand', ASCENDING), ('seen_at', DESCENDING), ('_id', DESCENDING),
+         ('year', ASCENDING), ('price', ASCENDING), ('mileage', ASCENDING)],
+        name='brand_recent_summary',
+    ),
+    IndexModel(
+        [('seen_at', DESCENDING), ('_id', DESCENDING),
+         ('year', ASCENDING), ('price', ASCENDING), ('mileage', ASCENDING),
+         ('brand', ASCENDING)],
+        name='recent_summary',
+    ),
+    # The pipeline upserts by url, so each listing is stored once
+    IndexModel([('url', ASCENDING)], name='url_unique', unique=True),
+]
+
+
+def dedupe_by_url(collection):
+    """Deletes all but the most recently seen document for each url.
+
+    Collections filled before the pipeline upserted by url hold one snapshot
+    per crawl; the unique url index cannot be built until they are removed.
+    Returns the number of deleted documents.
+    """
+    pipeline = [
+        {'$sort': {'url': ASCENDING, 'seen_at': DESCENDING, '_id': DESCENDING}},
+        {'$group': {'_id': '$url', 'ids': {'$push': '$_id'}, 'count': {'$sum': 1}}},
+        {'$match': {'count': {'$gt': 1}}},
+    ]
+    deleted = 0
+    for group in collection.aggregate(pipeline, allowDiskUse=True):
+        # The first id is the newest snapshot, which is kept
+        result = collection.delete_many({'_id': {'$in': group['ids'][1:]}})
+        deleted += result.deleted_count
+    if deleted:
+        logger.info(f"Removed {deleted} duplicate snapshots from {collection.name}")
+    return deleted
+
+
+def ensure_indexes(collection):
+    """Creates the declared indexes; a no-op for indexes that already exist"""
+    if 'url_unique' not in collection.index_information():
+        dedupe_by_url(collection)
+    names = collection.create_indexes(CARS_INDEXES)
+    logger.info(f"Indexes ready on {collection.name}: {', '.join(names)}")
+    return names
+
+
+def build_filter(brand=None, min_year=None, max_year=None, min_price=None,
+                 max_price=None):
+    """Builds a MongoDB filter from optional search criteria"""
+    query = {}
+    if brand is not None:
+        query['brand'] = brand
+    ranges = (('year', min_year, max_year), ('price', min_price, max_price))
+    for field, low, high in ranges:
+        bounds = {}
+        if low is not None:
+            bounds['$gte'] = low
+        if high is not None:
+            bounds['$lte'] = high
+        if bounds:
+            query[field] = bounds
+    return query
+
+
+def find_cars(collection, brand=None, min_year=None, max_year=None, min_price=None,
+              max_price=None, after=None, limit=20, projection=SUMMARY_PROJECTION):
+    """Returns one page of cars, most recently seen first.
+
+    Each listing is one document holding its latest crawled state, so every
+    car appears at most once. Cars with an unknown year or price never match
+    a range on that field.
+
+    Pages are keyset-paginated: pass the cursor returned with the previous
+    page as `after` to continue from where it ended, instead of skipping
+    over documents already read. Returns a (documents, next_cursor) tuple;
+    next_cursor is None on the last page. Pass projection=None to get full
+    documents.
+    """
+    query = build_filter(brand, min_year, max_year, min_price, max_price)
+    if after is not None:
+        seen_at, last_id = after
+        query['$or'] = [
+            {'seen_at': {'$lt': seen_at}},
+            {'seen_at': seen_at, '_id': {'$lt': last_id}},
+        ]
+
+    if projection is not None:
+        # The cursor needs the sort keys even if the caller did not ask for them
+        projection = {**projection, 'seen_at': 1, '_id': 1}
+
+    docs = list(
+        collection.find(query, projection)
+        .sort([('seen_at', DESCENDING), ('_id', DESCENDING)])
+        .limit(limit)
+    )
+    next_cursor = None
+    if len(docs) == limit:
+        next_cursor = (docs[-1]['seen_at'], docs[-1]['_id'])
+    return docs, next_cursor
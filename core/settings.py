@@ -75,6 +75,7 @@ DOWNLOADER_MIDDLEWARES = {
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 ITEM_PIPELINES = {
    'core.pipelines.MongoDBPipeline': 300,
+   'core.pipelines.PriceHistoryPipeline': 400,
 }
 
 # Enable and configure the AutoThrottle extension (disabled by default)
@@ -106,6 +107,16 @@ LOG_LEVEL = 'DEBUG'
 # Enable logging to file (optional, uncomment to use)
 # LOG_FILE = 'scraper.log'
 
+# Parse executor settings (offloads listing page parsing to worker processes)
+PARSE_EXECUTOR_ENABLED = False
+PARSE_EXECUTOR_WORKERS = 0  # 0 means one worker per CPU core
+PARSE_EXECUTOR_MAX_IN_FLIGHT = 0  # 0 means twice the number of workers
+PARSE_EXECUTOR_INLINE_THRESHOLD = 64 * 1024  # Pages smaller than this are parsed inline
+
+# Price history settings
+PRICE_HISTORY_DIR = 'history'
+PRICE_HISTORY_COMPACT_INTERVAL_DAYS = 7
+
 # Session settings
 SESSION_ENABLED = True
 SESSION_DURATION = 3600  # 1 hour in seconds
@@ -1,7 +1,6 @@
 # core/spiders/chileautos/config.py
-import os
-import json
 import logging
+from ...config.artifacts import catalogue_brands, load_dictionary, load_filters
 
 class ChileautosConfig:
     def __init__(self, spider):
@@ -9,21 +8,24 @@ class ChileautosConfig:
         self.logger = logging.getLogger(__name__)
         self.filters = self._load_filters()
         self.base_url = self._build_base_url()
+        self._known_brands = None
         
     def _load_filters(self):
-        """Loads filters from JSON file"""
-        filters_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-            'filters.json'
-        )
-        if not os.path.exists(filters_path):
-            raise FileNotFoundError(f"Filters not found at: {filters_path}")
-        try:
-            with open(filters_path, 'r', encoding='utf-8') as f:
-                return json.load(f).get('filters', {})
-        except Exception as e:
-            self.logger.error(f"Error loading filters: {str(e)}")
-            return {}
+        """Loads filters from the compiled filters.json artifact.
+
+        A missing, malformed or invalid file stops the spider: crawling
+        without filters would mean every brand and no page limit.
+        """
+        return load_filters()
+
+    @property
+    def known_brands(self):
+        """Brands from filters.json and dic.json, longest names first"""
+        if self._known_brands is None:
+            brands = set(self.filters.get('brands', []))
+            brands |= catalogue_brands(load_dictionary())
+            self._known_brands = sorted(brands, key=lambda b: (-len(b), b))
+        return self._known_brands
 
     def _build_base_url(self):
         """Builds base URL with brand filters"""
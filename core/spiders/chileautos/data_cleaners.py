@@ -20,9 +20,9 @@ class DataCleaner:
             return 0
             
         try:
-            clean = re.sub(r'[^\d.,]', '', mileage_text)
-            # Complete cleaning logic...
-            return int(float(clean))
+            # Listings use '.' as thousands separator, e.g. '45.000 km'
+            clean = re.sub(r'[^\d]', '', mileage_text)
+            return int(clean) if clean else 0
         except Exception as e:
             self.logger.error(f"Error cleaning mileage: {str(e)}")
             return 0
@@ -32,4 +32,21 @@ class DataCleaner:
         if not title:
             return 0
         year_match = re.search(r'\b20\d{2}\b', title)
-        return int(year_match.group()) if year_match else 0
\ No newline at end of file
+        return int(year_match.group()) if year_match else 0
+
+    def clean_year(self, year_text) -> int:
+        """Converts year text to integer"""
+        if not year_text:
+            return 0
+        year_match = re.search(r'\b(19|20)\d{2}\b', str(year_text))
+        return int(year_match.group()) if year_match else 0
+
+    def extract_brand(self, title, brands) -> Optional[str]:
+        """Returns the first of the given brands mentioned in the title"""
+        if not title:
+            return None
+        lowered = title.lower()
+        for brand in brands:
+            if re.search(rf'\b{re.escape(brand.lower())}\b', lowered):
+                return brand
+        return None
\ No newline at end of file
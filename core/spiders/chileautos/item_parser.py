@@ -1,8 +1,51 @@
 # core/spiders/chileautos/item_parser.py
 from scrapy import Selector
+from scrapy.http import HtmlResponse
 from ...items import CarItem
 import logging
 
+# Order of the values in the compact tuples returned by extract_listing_items
+LISTING_FIELDS = ('url', 'title', 'price', 'year', 'mileage')
+
+
+def extract_listing_rows(response):
+    """Extracts one compact tuple per listing item on a results page"""
+    rows = []
+    for item in response.css('.listing-items .listing-item'):
+        url = response.urljoin(item.css('h3 a::attr(href)').get()) or None
+        title = item.css('h3 a::text').get('').strip() or None
+        price = item.css('.price::text').get('').strip() or None
+
+        # Extract vehicle details
+        details = {
+            'Año': None,
+            'Kilómetros': None
+        }
+
+        for detail in item.css('.key-details__item'):
+            label = detail.css('.key-details__label::text').get('').strip().rstrip(':')
+            value = detail.css('.key-details__value::text').get('').strip()
+            if label in details:
+                details[label] = value or None
+
+        rows.append((url, title, price, details['Año'], details['Kilómetros']))
+    return rows
+
+
+def extract_listing_items(body, url, encoding):
+    """Worker entry point: rebuilds the response from raw bytes and extracts rows.
+
+    Must stay a module-level function so it can be pickled into a process pool.
+    """
+    response = HtmlResponse(url=url, body=body, encoding=encoding)
+    return extract_listing_rows(response)
+
+
+def build_car_item(row):
+    """Turns a compact listing tuple back into a CarItem"""
+    return CarItem(zip(LISTING_FIELDS, row))
+
+
 class ItemParser:
     def __init__(self, cleaner):
         self.cleaner = cleaner
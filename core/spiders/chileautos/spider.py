@@ -2,11 +2,16 @@
 import scrapy
 import logging
 from scrapy.spiders import Spider
-from ...items import CarItem
+from ...parse_executor import ParseExecutor
 from .config import ChileautosConfig
 from .request_builder import RequestBuilder
 from .data_cleaners import DataCleaner
-from .item_parser import ItemParser
+from .item_parser import (
+    ItemParser,
+    build_car_item,
+    extract_listing_items,
+    extract_listing_rows,
+)
 
 class ChileautosSpider(Spider):
     name = 'chileautos'
@@ -28,48 +33,60 @@ class ChileautosSpider(Spider):
         self.items_processed = 0
         self.processed_urls = set()
 
+    @property
+    def parse_executor(self):
+        """Parse executor built lazily, once crawler settings are available"""
+        if getattr(self, '_parse_executor', None) is None:
+            self._parse_executor = ParseExecutor.from_settings(self.settings)
+        return self._parse_executor
+
+    def closed(self, reason):
+        if getattr(self, '_parse_executor', None) is not None:
+            self._parse_executor.shutdown()
+
     def start_requests(self):
         yield from self.request_builder.generate_requests()
 
-    def parse(self, response):
+    async def parse(self, response):
         current_page = response.meta['page']
         self.pages_processed += 1
         self.logger.info(f"Processing page {current_page}")
 
         # Extract information directly from listing page items
-        items = response.css('.listing-items .listing-item')
-        self.logger.info(f"Found {len(items)} items on the page")
-
-        for item in items:
-            car_item = CarItem()
-            
-            # Extract basic information
-            car_item['url'] = response.urljoin(item.css('h3 a::attr(href)').get()) or None
-            car_item['title'] = item.css('h3 a::text').get('').strip() or None
-            car_item['price'] = item.css('.price::text').get('').strip() or None
-            
-            # Extract vehicle details
-            details = {
-                'Año': None,
-                'Kilómetros': None
-            }
-            
-            for detail in item.css('.key-details__item'):
-                label = detail.css('.key-details__label::text').get('').strip().rstrip(':')
-                value = detail.css('.key-details__value::text').get('').strip()
-                if label in details:
-                    details[label] = value or None
-            
-            car_item['year'] = details['Año']
-            car_item['mileage'] = details['Kilómetros']
+        if self.parse_executor.should_offload(response.body):
+            rows = await self.parse_executor.run(
+                extract_listing_items, response.body, response.url, response.encoding
+            )
+        else:
+            rows = extract_listing_rows(response)
+        self.logger.info(f"Found {len(rows)} items on the page")
 
+        for row in rows:
             self.items_processed += 1
-            yield car_item
+            yield self._clean_item(build_car_item(row))
 
         # Paginación
         if self._should_continue_pagination(current_page):
             yield self.request_builder.next_page_request(current_page)
 
+    def _clean_item(self, item):
+        """Normalizes listing values so they can be range-queried in MongoDB.
+
+        Missing or unparseable values stay None, so range filters skip them
+        instead of matching them as 0.
+        """
+        brands = self.config.known_brands
+        item['brand'] = self.cleaner.extract_brand(item['title'], brands)
+        item['price'] = self._clean_value(self.cleaner.clean_price, item['price'])
+        item['year'] = self._clean_value(self.cleaner.clean_year, item['year'])
+        item['mileage'] = self._clean_value(self.cleaner.clean_mileage, item['mileage'])
+        return item
+
+    def _clean_value(self, clean, text):
+        if not text:
+            return None
+        return clean(text) or None
+
     def _should_continue_pagination(self, current_page):
         """Determines if pagination should continue"""
         max_pages = self.config.filters.get('max_pages')